@@ -1,20 +1,28 @@
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 import pandas as pd
 import os
 from dotenv import load_dotenv
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
 import asyncio
 import logging
-import time
+import csv
+import io
+import re
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+log = logging.getLogger(__name__)
 
 # Load environment variables
 load_dotenv()
 TOKEN = os.getenv('DISCORD_TOKEN')
 if not TOKEN:
-    logging.error("DISCORD_TOKEN not found in .env file")
+    log.error("DISCORD_TOKEN not found in .env file")
     exit(1)
 
 # Set up bot with intents
@@ -26,199 +34,302 @@ bot = commands.Bot(command_prefix='!', intents=intents)
 # Excel file path
 EXCEL_FILE = 'rental_data.csv'
 
-# Store previous Excel state to detect changes
-previous_data = None
+# Column dtypes of EXCEL_FILE, built once instead of on every read
+COLUMN_TYPES = {'Message ID': pd.Int64Dtype(), 'Channel ID': pd.Int64Dtype(), 'Name': str, 'Product Name': str, 'Rent or Buy': str, 'Phone No': str, 'Query': str, 'Status': str}
+COLUMN_ORDER = list(COLUMN_TYPES)
+
+# Discord IDs don't fit in a float64, so read them as nullable ints
+ID_COLUMNS = ('Message ID', 'Channel ID')
+ID_COLUMN_TYPES = {col: COLUMN_TYPES[col] for col in ID_COLUMNS}
+
+# Columns the status check needs, parsed with pyarrow's multithreaded reader when available
+STATUS_COLUMNS = ['Message ID', 'Channel ID', 'Status']
+CSV_ENGINE = 'pyarrow' if importlib.util.find_spec('pyarrow') else 'c'
+
+# Last seen Status per Message ID, used to detect changes
+status_cache: dict[int, str] = {}
+
+# (st_mtime_ns, st_size) of EXCEL_FILE at the last status check, so repeated events for one save are skipped
+last_file_stat = None
+
+# Where the OS reports no close-after-write, wait this long after the last modify event before checking
+FILE_EVENT_DEBOUNCE = 1.0  # seconds
+
+# Watches EXCEL_FILE for writes, started once in on_ready
+observer = None
+
+# '#rent'/'#buy' prefix; the comma-separated fields follow in the 'args' group
+COMMAND_RE = re.compile(r'#(?:rent|buy)(?P<args>.*)', re.IGNORECASE | re.DOTALL)
+
+# Statuses that trigger a reply to the original order message
+VALID_STATUSES = frozenset({'issued', 'cancelled', 'delivered'})
 
 MAX_RETRIES = 5
+# Retries wait 5, 10, 10 and 10 seconds: RETRY_DELAY doubles per attempt but is
+# capped at MAX_RETRY_DELAY, so a file that stays locked fails in about 35 seconds
 RETRY_DELAY = 5  # seconds
+MAX_RETRY_DELAY = 10  # seconds
+
+# All CSV reads and writes run on this single worker, so the event loop never
+# blocks on file I/O and appends can never interleave
+IO_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='csv-io')
+
+# Serializes status checks when several file events arrive at once, created in on_ready
+status_check_lock = None
+
+# Fill in missing columns of an existing Excel file and check its dtypes
+def _sync_verify_excel():
+    df = pd.read_csv(EXCEL_FILE, dtype=ID_COLUMN_TYPES, na_values=[''])
+    missing_cols = [col for col in COLUMN_ORDER if col not in df.columns]
+    for col in missing_cols:
+        df[col] = pd.NA if col in ID_COLUMNS else ''
+    # Re-apply dtypes for all columns, especially after reading CSV which might infer types differently
+    df = df.astype(COLUMN_TYPES)
+    if missing_cols:
+        log.warning("Missing columns %s in %s. Adding them.", missing_cols, EXCEL_FILE)
+        df.to_csv(EXCEL_FILE, index=False)
+        log.info("Successfully updated %s with missing columns.", EXCEL_FILE)
+    else:
+        # The astype above already validated the dtypes, so the file is left untouched
+        log.info("Successfully verified columns and dtypes for %s.", EXCEL_FILE)
+
+# Append a single row instead of rewriting the whole file
+def _sync_append(data):
+    with open(EXCEL_FILE, 'rb+') as f:
+        # The header decides the column order so manually reordered files stay valid;
+        # utf-8-sig drops the BOM that Excel's "CSV UTF-8" format writes
+        header = next(csv.reader([f.readline().decode('utf-8-sig')]), None)
+        if not header:
+            raise FileNotFoundError(EXCEL_FILE)
+        row = io.StringIO()
+        csv.writer(row, lineterminator=os.linesep).writerow(['' if pd.isna(data.get(col)) else data.get(col) for col in header])
+        # Hand edits can leave the last record without a line break, so add one before appending
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) not in (b'\n', b'\r'):
+            f.write(os.linesep.encode())
+        f.write(row.getvalue().encode('utf-8'))
+
+# Read only STATUS_COLUMNS; the nullable backend keeps IDs as exact Int64 without an astype pass
+def _sync_read_statuses():
+    df = pd.read_csv(EXCEL_FILE, usecols=STATUS_COLUMNS, dtype={**ID_COLUMN_TYPES, 'Status': pd.StringDtype()}, na_values=[''], engine=CSV_ENGINE, dtype_backend='numpy_nullable')
+    df['Status'] = df['Status'].fillna('')
+    return df
+
+# Run blocking file I/O on IO_EXECUTOR without stalling the event loop
+def run_io(func, *args):
+    return bot.loop.run_in_executor(IO_EXECUTOR, func, *args)
+
+# Wait before retrying after a PermissionError; the last attempt returns at once so
+# the caller's for/else reports the failure without a pointless sleep
+async def _backoff(attempt, action):
+    if attempt == MAX_RETRIES - 1:
+        return
+    delay = min(RETRY_DELAY * 2 ** attempt, MAX_RETRY_DELAY)
+    log.warning("Permission denied when %s %s, retrying in %d seconds... (Attempt %d/%d)", action, EXCEL_FILE, delay, attempt + 1, MAX_RETRIES)
+    await asyncio.sleep(delay)
 
 # Initialize Excel file if it doesn't exist
-def init_excel():
-    columns = {'Message ID': pd.Int64Dtype(), 'Name': str, 'Product Name': str, 'Rent or Buy': str, 'Phone No': str, 'Query': str, 'Status': str}
-    df_columns = list(columns.keys())
-    if not os.path.exists(EXCEL_FILE):
-        logging.info(f"Creating new CSV file: {EXCEL_FILE}")
-        df = pd.DataFrame(columns=df_columns).astype(columns)
+async def init_excel():
+    if not os.path.exists(EXCEL_FILE) or os.path.getsize(EXCEL_FILE) == 0:
+        log.info("Creating new CSV file: %s", EXCEL_FILE)
+        df = pd.DataFrame(columns=COLUMN_ORDER).astype(COLUMN_TYPES)
         for attempt in range(MAX_RETRIES):
             try:
-                df.to_csv(EXCEL_FILE, index=False)
-                logging.info(f"Successfully created {EXCEL_FILE}")
+                await run_io(partial(df.to_csv, EXCEL_FILE, index=False))
+                log.info("Successfully created %s", EXCEL_FILE)
                 break
             except PermissionError:
-                logging.warning(f"Permission denied when creating {EXCEL_FILE}, retrying in {RETRY_DELAY} seconds... (Attempt {attempt + 1}/{MAX_RETRIES})")
-                time.sleep(RETRY_DELAY)
+                await _backoff(attempt, "creating")
             except Exception as e:
-                logging.error(f"Error creating {EXCEL_FILE}: {str(e)}")
+                log.error("Error creating %s: %s", EXCEL_FILE, e)
                 exit(1)
         else:
-            logging.error(f"Failed to create {EXCEL_FILE} after {MAX_RETRIES} attempts due to permission issues.")
+            log.error("Failed to create %s after %d attempts due to permission issues.", EXCEL_FILE, MAX_RETRIES)
             exit(1)
     else:
         # Verify existing file has correct columns and types
         for attempt in range(MAX_RETRIES):
             try:
-                df = pd.read_csv(EXCEL_FILE, dtype={'Message ID': pd.Int64Dtype()}, na_values=[''])
-                # Re-apply dtypes for all columns, especially after reading CSV which might infer types differently
-                df = df.astype(columns)
-                missing_cols = [col for col in df_columns if col not in df.columns]
-                if missing_cols:
-                    logging.warning(f"Missing columns {missing_cols} in {EXCEL_FILE}. Adding them.")
-                    for col in missing_cols:
-                        df[col] = pd.NA if col == 'Message ID' else ''
-                    df = df.astype(columns) # Re-apply astype after adding columns
-                    df.to_csv(EXCEL_FILE, index=False)
-                    logging.info(f"Successfully updated {EXCEL_FILE} with missing columns.")
-                else:
-                    # Ensure correct dtypes are applied even if columns exist
-                    df = pd.read_csv(EXCEL_FILE, dtype={'Message ID': pd.Int64Dtype()}, na_values=['']).astype(columns)
-                    df.to_csv(EXCEL_FILE, index=False)
-                    logging.info(f"Successfully ensured correct dtypes for {EXCEL_FILE}.")
+                await run_io(_sync_verify_excel)
                 break # Exit retry loop on success
             except PermissionError:
-                logging.warning(f"Permission denied when verifying/updating {EXCEL_FILE}, retrying in {RETRY_DELAY} seconds... (Attempt {attempt + 1}/{MAX_RETRIES})")
-                time.sleep(RETRY_DELAY)
+                await _backoff(attempt, "verifying/updating")
             except Exception as e:
-                logging.error(f"Error reading or verifying {EXCEL_FILE}: {str(e)}")
+                log.error("Error reading or verifying %s: %s", EXCEL_FILE, e)
                 exit(1)
         else:
-            logging.error(f"Failed to verify/update {EXCEL_FILE} after {MAX_RETRIES} attempts due to permission issues.")
+            log.error("Failed to verify/update %s after %d attempts due to permission issues.", EXCEL_FILE, MAX_RETRIES)
             exit(1)
 
 # Append data to Excel
-def append_to_excel(data):
-    df = None
+async def append_to_excel(data):
     for attempt in range(MAX_RETRIES):
         try:
-            # Read with specified dtypes to maintain consistency
-            # For CSV, explicitly specify dtype for Message ID as pandas might infer differently
-            df = pd.read_csv(EXCEL_FILE, dtype={'Message ID': pd.Int64Dtype()}, na_values=[''])
-            # Ensure all columns have their intended types after reading CSV
-            columns = {'Message ID': pd.Int64Dtype(), 'Name': str, 'Product Name': str, 'Rent or Buy': str, 'Phone No': str, 'Query': str, 'Status': str}
-            df = df.astype(columns)
-            break # Exit retry loop on successful read
+            await run_io(_sync_append, data)
+            log.info("Appended new row to CSV successfully!")
+            break
         except FileNotFoundError:
-            logging.warning(f"{EXCEL_FILE} not found, initializing... (Attempt {attempt + 1}/{MAX_RETRIES})")
-            init_excel()
-            # After init, try reading again in the next loop iteration
-            continue 
+            log.warning("%s not found, initializing... (Attempt %d/%d)", EXCEL_FILE, attempt + 1, MAX_RETRIES)
+            await init_excel()
+            # After init, try appending again in the next loop iteration
+            continue
         except PermissionError:
-            logging.warning(f"Permission denied when reading {EXCEL_FILE}, retrying in {RETRY_DELAY} seconds... (Attempt {attempt + 1}/{MAX_RETRIES})")
-            time.sleep(RETRY_DELAY)
+            await _backoff(attempt, "writing to")
         except Exception as e:
-            logging.error(f"Error reading {EXCEL_FILE}: {str(e)}")
+            log.error("Error writing to %s: %s", EXCEL_FILE, e)
             return
     else:
-        logging.error(f"Failed to read {EXCEL_FILE} after {MAX_RETRIES} attempts due to permission issues.")
-        return
+        log.error("Failed to write to %s after %d attempts due to permission issues.", EXCEL_FILE, MAX_RETRIES)
 
-    if df is None:
-        logging.error("Failed to read CSV file, cannot append data.")
-        return
-    
-    new_row = pd.DataFrame([data])
-    # Ensure new_row has the same columns and dtypes as df
-    columns_dict = { 'Message ID': pd.Int64Dtype(), 'Name': str, 'Product Name': str, 'Rent or Buy': str, 'Phone No': str, 'Query': str, 'Status': str}
-    for col in columns_dict.keys():
-        if col not in new_row.columns:
-            new_row[col] = pd.NA if col == 'Message ID' else ''
-    new_row = new_row[df.columns].astype(dtype=columns_dict)
-
-    df = pd.concat([df, new_row], ignore_index=True)
-    for attempt in range(MAX_RETRIES):
-        try:
-            df.to_csv(EXCEL_FILE, index=False)
-            logging.info("Appended new row to CSV successfully!")
-            break
-        except PermissionError:
-            logging.warning(f"Permission denied when writing to {EXCEL_FILE}, retrying in {RETRY_DELAY} seconds... (Attempt {attempt + 1}/{MAX_RETRIES})")
-            time.sleep(RETRY_DELAY)
-        except Exception as e:
-            logging.error(f"Error writing to {EXCEL_FILE}: {str(e)}")
-            return
-    else:
-        logging.error(f"Failed to write to {EXCEL_FILE} after {MAX_RETRIES} attempts due to permission issues.")
+# Drop rows without a Message ID and normalize Status for comparison
+def normalize_statuses(df):
+    df = df.dropna(subset=['Message ID'])
+    df = df.assign(Status=df['Status'].str.strip().str.lower())
+    return df
+
+# Map each Message ID to its normalized Status
+def build_status_index(df):
+    df = normalize_statuses(df)
+    return dict(zip(df['Message ID'].tolist(), df['Status'].tolist()))
+
+# Schedule a status check once EXCEL_FILE has finished being written
+class ExcelChangeHandler(FileSystemEventHandler):
+    def __init__(self, loop):
+        self.loop = loop
+        self.path = os.path.abspath(EXCEL_FILE)
+        self.pending_check = None
+
+    # Events fire on the observer thread, so these only ever run on the bot loop
+    def _check_now(self):
+        if self.pending_check is not None:
+            self.pending_check.cancel()
+            self.pending_check = None
+        self.loop.create_task(check_excel_status())
+
+    def _check_later(self):
+        # Every modify event pushes the check back, so a file is only read once writes stop
+        if self.pending_check is not None:
+            self.pending_check.cancel()
+        self.pending_check = self.loop.call_later(FILE_EVENT_DEBOUNCE, self._check_now)
+
+    def _is_excel_file(self, path):
+        return os.path.abspath(path) == self.path
+
+    def on_closed(self, event):
+        # inotify IN_CLOSE_WRITE: the writer has finished with the file
+        if self._is_excel_file(event.src_path):
+            self.loop.call_soon_threadsafe(self._check_now)
 
-# Background task to monitor Excel for status changes
-@tasks.loop(seconds=10)
+    def on_moved(self, event):
+        # Excel saves by writing a temp file and renaming it over the original
+        if self._is_excel_file(event.dest_path):
+            self.loop.call_soon_threadsafe(self._check_now)
+
+    def on_modified(self, event):
+        # Fallback for platforms without close events: only read once writes have paused
+        if self._is_excel_file(event.src_path):
+            self.loop.call_soon_threadsafe(self._check_later)
+
+# Reply to the original order message with its new status
+async def send_status_update(message_id, channel_id, status):
+    try:
+        # A partial message only needs the IDs, so the reply goes out without fetching anything first
+        message = bot.get_partial_messageable(channel_id).get_partial_message(message_id)
+        await message.reply(f"Your order is {status.capitalize()}!")
+        log.info("Sent status update for Message ID %d", message_id)
+    except discord.NotFound:
+        log.warning("Message ID %d not found or invalid", message_id)
+    except discord.Forbidden:
+        log.warning("No permission to access channel %s", channel_id)
+
+# Modification time and size of EXCEL_FILE, used to tell whether it changed
+def excel_file_stat():
+    st = os.stat(EXCEL_FILE)
+    return st.st_mtime_ns, st.st_size
+
+# Check Excel for status changes
 async def check_excel_status():
-    global previous_data
+    async with status_check_lock:
+        await _check_excel_status()
+
+async def _check_excel_status():
+    global last_file_stat
     try:
-        # Read current CSV data with specified dtypes
-        current_data = pd.read_csv(EXCEL_FILE, dtype={'Message ID': pd.Int64Dtype()}, na_values=[''])
-        columns = {'Message ID': pd.Int64Dtype(), 'Name': str, 'Product Name': str, 'Rent or Buy': str, 'Phone No': str, 'Query': str, 'Status': str}
-        current_data = current_data.astype(columns)
-        logging.info("Checked CSV file for status changes")
-        
-        if previous_data is not None:
-            # Compare rows to detect status changes
-            for index, row in current_data.iterrows():
-                message_id = str(row['Message ID']).strip() if pd.notna(row['Message ID']) else ""
-                current_status = str(row['Status']).strip().lower()
-                
-                # Get previous status for this row
-                # Ensure 'Message ID' is treated as string for comparison with previous_data
-                previous_row = previous_data[previous_data['Message ID'].astype(str) == message_id]
-                previous_status = str(previous_row['Status'].iloc[0]).strip().lower() if not previous_row.empty and pd.notna(previous_row['Status'].iloc[0]) else ""
-                
-                # Check if status has changed and is valid
-                valid_statuses = ['issued', 'cancelled', 'delivered']
-                if message_id and current_status != previous_status and current_status in valid_statuses:
-                    logging.info(f"Status changed for Message ID {message_id}: {previous_status} -> {current_status}")
-                    try:
-                        # Fetch the original message
-                        message = None
-                        for guild in bot.guilds:
-                            for channel in guild.text_channels:
-                                try:
-                                    message = await channel.fetch_message(int(message_id))
-                                    break
-                                except (discord.NotFound, ValueError):
-                                    continue
-                                except discord.Forbidden:
-                                    logging.warning(f"No permission to access channel {channel.id}")
-                                    continue
-                        
-                        if message:
-                            await message.reply(f"Your order is {current_status.capitalize()}!")
-                            logging.info(f"Sent status update for Message ID {message_id}")
-                        else:
-                            logging.warning(f"Message ID {message_id} not found or invalid")
-                    except Exception as e:
-                        logging.error(f"Error sending status update for Message ID {message_id}: {str(e)}")
-        
-        # Update previous_data, ensuring correct dtypes are maintained
-        previous_data = current_data.copy()
-    
+        # Nothing to do if the file hasn't been written since the last check; the size
+        # catches rewrites that land within one tick of a coarse-timestamp filesystem
+        file_stat = excel_file_stat()
+        if file_stat == last_file_stat:
+            return
+
+        # Read the current Message ID, Channel ID and Status columns
+        current_data = await run_io(_sync_read_statuses)
+        if excel_file_stat() != file_stat:
+            # Written to while being read; the event for that write triggers another check
+            log.info("%s changed while being read, deferring status check", EXCEL_FILE)
+            return
+        log.info("Checked CSV file for status changes")
+
+        # Compare every row against the cached status in one vectorized pass
+        current_data = normalize_statuses(current_data)
+        previous_statuses = current_data['Message ID'].map(status_cache).fillna("")
+        changed = (current_data['Status'] != previous_statuses) & current_data['Status'].isin(VALID_STATUSES)
+
+        # Only rows whose status has changed and is valid get a reply
+        replies = []
+        updated_ids = []
+        for message_id, channel_id, current_status, previous_status in zip(
+            current_data.loc[changed, 'Message ID'].tolist(),
+            current_data.loc[changed, 'Channel ID'].tolist(),
+            current_data.loc[changed, 'Status'].tolist(),
+            previous_statuses[changed].tolist(),
+        ):
+            log.info("Status changed for Message ID %d: %s -> %s", message_id, previous_status, current_status)
+            if pd.isna(channel_id):
+                log.warning("No Channel ID recorded for Message ID %d, skipping status update", message_id)
+                continue
+            updated_ids.append(message_id)
+            replies.append(send_status_update(message_id, channel_id, current_status))
+
+        # Send all replies concurrently; discord.py handles the rate limits
+        results = await asyncio.gather(*replies, return_exceptions=True)
+        for message_id, result in zip(updated_ids, results):
+            if isinstance(result, Exception):
+                log.error("Error sending status update for Message ID %d: %s", message_id, result)
+
+        # Update rather than replace, so a row missing from one read is never treated as new later
+        status_cache.update(zip(current_data['Message ID'].tolist(), current_data['Status'].tolist()))
+        last_file_stat = file_stat
+
     except FileNotFoundError:
-        logging.error(f"{EXCEL_FILE} not found")
-        init_excel()
+        log.error("%s not found", EXCEL_FILE)
+        await init_excel()
     except PermissionError:
-        logging.error(f"Permission denied when reading {EXCEL_FILE}")
+        log.error("Permission denied when reading %s", EXCEL_FILE)
     except Exception as e:
-        logging.error(f"Error in check_excel_status: {str(e)}")
+        log.error("Error in check_excel_status: %s", e)
 
 # Event: Bot is ready
 @bot.event
 async def on_ready():
     print(f'{bot.user} has connected to Discord!')
-    logging.info(f"Bot connected as {bot.user}")
-    init_excel()
-    global previous_data
+    log.info("Bot connected as %s", bot.user)
+    await init_excel()
+    global status_cache
     try:
-        previous_data = pd.read_csv(EXCEL_FILE, dtype={'Message ID': pd.Int64Dtype()}, na_values=[''])
-        columns = {'Message ID': pd.Int64Dtype(), 'Name': str, 'Product Name': str, 'Rent or Buy': str, 'Phone No': str, 'Query': str, 'Status': str}
-        previous_data = previous_data.astype(columns)
+        status_cache = build_status_index(await run_io(_sync_read_statuses))
     except FileNotFoundError:
-        init_excel()
-        previous_data = pd.read_csv(EXCEL_FILE, dtype={'Message ID': pd.Int64Dtype()}, na_values=[''])
-        columns = {'Message ID': pd.Int64Dtype(), 'Name': str, 'Product Name': str, 'Rent or Buy': str, 'Phone No': str, 'Query': str, 'Status': str}
-        previous_data = previous_data.astype(columns)
+        await init_excel()
+        status_cache = build_status_index(await run_io(_sync_read_statuses))
     except Exception as e:
-        logging.error(f"Error initializing previous_data: {str(e)}")
+        log.error("Error initializing status_cache: %s", e)
         exit(1)
-    if not check_excel_status.is_running():
-        check_excel_status.start()
-        logging.info("Started check_excel_status task")
+    global observer, status_check_lock
+    if observer is None:
+        status_check_lock = asyncio.Lock()
+        observer = Observer()
+        observer.schedule(ExcelChangeHandler(bot.loop), os.path.dirname(os.path.abspath(EXCEL_FILE)))
+        observer.start()
+        log.info("Watching %s for status changes", EXCEL_FILE)
 
 # Event: Process messages
 @bot.event
@@ -227,15 +338,17 @@ async def on_message(message):
     if message.author == bot.user:
         return
 
+    # Most chat isn't an order, so skip the parser unless it could be one
+    if not message.content.startswith('#'):
+        await bot.process_commands(message)
+        return
+
     # Check if message starts with #rent or #buy
-    if message.content.lower().startswith(('#rent', '#buy')):
+    command = COMMAND_RE.match(message.content)
+    if command:
         try:
-            # Determine if it's a rent or buy request and remove the prefix
-            is_rent = message.content.lower().startswith('#rent')
-            content = message.content[len('#rent'):].strip() if is_rent else message.content[len('#buy'):].strip()
-            
             # Split the message by commas
-            parts = [part.strip() for part in content.split(',')]
+            parts = [part.strip() for part in command['args'].split(',')]
             
             # Ensure exactly 5 parts (name, product name, rent or buy, phone no, query)
             if len(parts) != 5:
@@ -245,13 +358,15 @@ async def on_message(message):
             name, product_name, rent_or_buy, phone_no, query = parts
             
             # Validate rent_or_buy
-            if rent_or_buy.lower() not in ['rent', 'buy']:
+            rent_or_buy = rent_or_buy.lower()
+            if rent_or_buy not in ('rent', 'buy'):
                 await message.channel.send("Please specify 'rent' or 'buy' in the third field.")
                 return
             
             # Store in Excel with Message ID and empty Status
             data = {
                 'Message ID': message.id,
+                'Channel ID': message.channel.id,
                 'Name': name,
                 'Product Name': product_name,
                 'Rent or Buy': rent_or_buy.capitalize(),
@@ -259,14 +374,15 @@ async def on_message(message):
                 'Query': query,
                 'Status': ''  # Initialize status as an empty string
             }
-            append_to_excel(data)
+            await append_to_excel(data)
+            status_cache.setdefault(message.id, '')
             
             await message.channel.send("Message recorded successfully!")
-            logging.info(f"Processed message from {message.author}: {message.content}")
+            log.info("Processed message from %s: %s", message.author, message.content)
         
         except Exception as e:
             await message.channel.send(f"Error processing message: {str(e)}")
-            logging.error(f"Error processing message: {str(e)}")
+            log.error("Error processing message: %s", e)
     
     # Process commands if any
     await bot.process_commands(message)